@@ -1153,6 +1153,8 @@ class CLI(cmd.Cmd, Context):
         self.rv = 0          #: Return value to be returned
         self._stack = []     #: List of commands being processed
         self._client = None  #: Single client for all activities
+        #: Client already checked by conn() during the current onecmd()
+        self._checked_client = None
         #: Paths to be loaded; initially official plugins
         self._plugin_paths = [OMEROCLI / "plugins"]
         self._pluginsLoaded = CLI.PluginsLoaded()
@@ -1241,6 +1243,7 @@ class CLI(cmd.Cmd, Context):
             # Starting a new command. Reset the return value to 0
             # If err or die are called, set rv non-0 value
             self.rv = 0
+            self._checked_client = None
             try:
                 self._stack.insert(0, line)
                 self.dbg("Stack+: %s" % len(self._stack), level=2)
@@ -1504,15 +1507,23 @@ class CLI(cmd.Cmd, Context):
         If required attributes are missing, will delegate to the login
         command.
 
+        The client is only pinged once per call to onecmd() so that
+        plugins calling conn() repeatedly, e.g. admin_only and then the
+        decorated method, do not pay for an extra round-trip each time.
+
         FIXME: Currently differing setting sessions on the same CLI instance
         will misuse a client.
         """
-        if self.get_client():
+        client = self.get_client()
+        if client:
+            if client is self._checked_client:
+                return client
             self.dbg("Found client")
             try:
-                self.get_client().getSession().keepAlive(None)
+                client.getSession().keepAlive(None)
                 self.dbg("Using client")
-                return self.get_client()
+                self._checked_client = client
+                return client
             except KeyboardInterrupt:
                 raise
             except Exception, e:
@@ -1633,6 +1644,14 @@ class CLI(cmd.Cmd, Context):
 
     def set_client(self, client):
         setattr(self, '_client', client)
+        self.reset_client_check()
+
+    def reset_client_check(self):
+        """
+        Ensure the next call to conn() pings the active client again,
+        e.g. after a session has been killed.
+        """
+        setattr(self, '_checked_client', None)
 
     # End Cli
     ###########################################################
@@ -2174,6 +2193,10 @@ class GraphControl(CmdControl):
 
 class UserGroupControl(BaseControl):
 
+    def __init__(self, ctx=None, dir=OMERODIR):
+        BaseControl.__init__(self, ctx, dir)
+        self._roles_cache = None  #: (event context, security roles)
+
     def error_no_input_group(self, msg="No input group is specified",
                              code=501, fatal=True):
         if fatal:
@@ -2367,6 +2390,22 @@ class UserGroupControl(BaseControl):
             admin.removeGroups(omero.model.ExperimenterI(user, False), [group])
             self.ctx.out("Removed %s from group %s" % (user, group.id.val))
 
+    def addgroupsbyid(self, admin, user, groups):
+        import omero
+        if not groups:
+            return
+        admin.addGroups(omero.model.ExperimenterI(user, False), groups)
+        for group in groups:
+            self.ctx.out("Added %s to group %s" % (user, group.id.val))
+
+    def removegroupsbyid(self, admin, user, groups):
+        import omero
+        if not groups:
+            return
+        admin.removeGroups(omero.model.ExperimenterI(user, False), groups)
+        for group in groups:
+            self.ctx.out("Removed %s from group %s" % (user, group.id.val))
+
     def addownersbyid(self, admin, group, users):
         import omero
         for user in list(users):
@@ -2383,6 +2422,22 @@ class UserGroupControl(BaseControl):
             self.ctx.out("Removed %s from the owner list of group %s"
                          % (user, group.id.val))
 
+    def _get_roles(self, admin):
+        """
+        Return the security roles of the server, cached until the event
+        context of the CLI changes. invoke() closes the client after each
+        top-level command, and the next login stores a new event context,
+        so a single "omero user add" or "omero user list" never hits the
+        cache. It is only reused when the client outlives a command: in
+        the omero shell, where cmdloop() calls onecmd() directly rather
+        than invoke(), or for commands nested in another, e.g. by
+        "omero load".
+        """
+        ec = self.ctx.get_event_context()
+        if self._roles_cache is None or self._roles_cache[0] is not ec:
+            self._roles_cache = (ec, admin.getSecurityRoles())
+        return self._roles_cache[1]
+
     def getuserids(self, group):
         ids = [x.child.id.val for x in group.copyGroupExperimenterMap()]
         return ids
@@ -2398,7 +2453,7 @@ class UserGroupControl(BaseControl):
         return ids
 
     def output_users_list(self, admin, users, args):
-        roles = admin.getSecurityRoles()
+        roles = self._get_roles(admin)
         user_group = roles.userGroupId
         sys_group = roles.systemGroupId
 
@@ -2447,9 +2502,9 @@ class UserGroupControl(BaseControl):
                 elif sys_group == gid:
                     admin = "Yes"
                 elif x.owner.val:
-                    leader_of.append(str(gid))
+                    leader_of.append(gid)
                 else:
-                    member_of.append(str(gid))
+                    member_of.append(gid)
 
             row.append(active)
             row.append(ldap)
@@ -2459,14 +2514,14 @@ class UserGroupControl(BaseControl):
                 if args.count:
                     row.append(len(member_of))
                 else:
-                    row.append(",".join(member_of))
+                    row.append(",".join(map(str, member_of)))
             else:
                 row.append("")
             if leader_of:
                 if args.count:
                     row.append(len(leader_of))
                 else:
-                    row.append(",".join(leader_of))
+                    row.append(",".join(map(str, leader_of)))
             else:
                 row.append("")
 
@@ -2622,10 +2677,97 @@ class UserGroupControl(BaseControl):
                            help="Name of the group%s" % action)
         return group
 
-    def list_groups(self, a, args, use_context=False):
+    def find_groups(self, query, args):
         """
-        Retrieve users from the arguments defined in
-        :meth:`add_user_arguments`
+        Retrieve the groups defined in :meth:`add_group_arguments` with
+        a single call to the query service rather than one lookup per
+        group. Unknown, invalid or ambiguous groups are reported as
+        non-fatal errors, as done by :meth:`find_group`,
+        :meth:`find_group_by_id` and :meth:`find_group_by_name`.
+        """
+        from omero.rtypes import rlist, rlong, rstring
+        from omero.sys import ParametersI
+
+        names = set(args.group_name or [])
+        ids = set()
+        for group in args.group_id_or_name or []:
+            names.add(group)
+            try:
+                ids.add(long(group))
+            except ValueError:
+                pass
+        for group_id in args.group_id or []:
+            try:
+                ids.add(long(group_id))
+            except ValueError:
+                pass
+
+        clauses = []
+        params = ParametersI()
+        if names:
+            clauses.append("g.name in (:names)")
+            params.add("names", rlist([rstring(x) for x in names]))
+        if ids:
+            clauses.append("g.id in (:ids)")
+            params.add("ids", rlist([rlong(x) for x in ids]))
+
+        found = []
+        if clauses:
+            found = query.findAllByQuery(
+                "select distinct g from ExperimenterGroup g "
+                "left outer join fetch g.groupExperimenterMap m "
+                "left outer join fetch m.child where " +
+                " or ".join(clauses), params, {"omero.group": "-1"})
+        by_name = dict((g.name.val, g) for g in found)
+        by_id = dict((g.id.val, g) for g in found)
+
+        gid_list = []
+        g_list = []
+        for group in args.group_id_or_name or []:
+            g1 = by_name.get(group)
+            try:
+                g2 = by_id.get(long(group))
+            except ValueError:
+                g2 = None
+            if g1 and g2 and g1.id.val != g2.id.val:
+                self.error_ambiguous_group(group, fatal=False)
+                continue
+            g = g1 or g2
+            if g:
+                gid_list.append(g.id.val)
+                g_list.append(g)
+            else:
+                self.error_invalid_group(group, fatal=False)
+
+        for group_id in args.group_id or []:
+            try:
+                gid = long(group_id)
+            except ValueError:
+                self.error_invalid_groupid(group_id, fatal=False)
+                continue
+            g = by_id.get(gid)
+            if g:
+                gid_list.append(gid)
+                g_list.append(g)
+            else:
+                self.error_invalid_group(gid, fatal=False)
+
+        for group_name in args.group_name or []:
+            g = by_name.get(group_name)
+            if g:
+                gid_list.append(g.id.val)
+                g_list.append(g)
+            else:
+                self.error_invalid_group(group_name, fatal=False)
+
+        return gid_list, g_list
+
+    def list_groups(self, a, q, args, use_context=False):
+        """
+        Retrieve groups from the arguments defined in
+        :meth:`add_group_arguments` using the admin service a and the
+        query service q. If use_context is set and no group arguments
+        are given, the group of the current event context is returned.
         """
 
         # Check input arguments
@@ -2635,28 +2777,7 @@ class UserGroupControl(BaseControl):
             self.error_no_input_group(fatal=True)
 
         # Retrieve groups by id or name
-        gid_list = []
-        g_list = []
-        if args.group_id_or_name:
-            for group in args.group_id_or_name:
-                [gid, g] = self.find_group(a, group, fatal=False)
-                if g:
-                    gid_list.append(gid)
-                    g_list.append(g)
-
-        if args.group_id:
-            for group_id in args.group_id:
-                [gid, g] = self.find_group_by_id(a, group_id, fatal=False)
-                if g:
-                    gid_list.append(gid)
-                    g_list.append(g)
-
-        if args.group_name:
-            for group_name in args.group_name:
-                [gid, g] = self.find_group_by_name(a, group_name, fatal=False)
-                if g:
-                    gid_list.append(gid)
-                    g_list.append(g)
+        gid_list, g_list = self.find_groups(q, args)
 
         if not gid_list:
             if not use_context or has_group_arguments:
@@ -2986,7 +2986,7 @@ class _BlitzGateway (object):
         rv = q.findAllByQuery(
             "from Experimenter e where lower(e.omeName) like :start",
             params, self.SERVICE_OPTS)
-        rv.sort(lambda x, y: cmp(x.omeName.val, y.omeName.val))
+        rv.sort(key=lambda x: x.omeName.val)
         for e in rv:
             yield ExperimenterWrapper(self, e)
 
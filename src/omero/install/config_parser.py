@@ -366,7 +366,7 @@ class PropertyParser(object):
                 headers.setdefault(additional_headers[section], []).append(x)
 
         for key in headers.iterkeys():
-            headers[key].sort(lambda a, b: cmp(a.key, b.key))
+            headers[key].sort(key=lambda x: x.key)
         return headers
 
     def print_defaults(self):
@@ -611,7 +611,7 @@ Examples:
         shared = client.sf.sharedResources()
         repos = shared.repositories()
         repos = zip(repos.descriptions, repos.proxies)
-        repos.sort(lambda a, b: cmp(a[0].id.val, b[0].id.val))
+        repos.sort(key=lambda x: x[0].id.val)
 
         tb = self._table(args)
         tb.cols(["Id", "UUID", "Type", "Path"])
@@ -815,7 +815,7 @@ Examples:
         shared = client.sf.sharedResources()
         repos = shared.repositories()
         repos = zip(repos.descriptions, repos.proxies)
-        repos.sort(lambda a, b: cmp(a[0].id.val, b[0].id.val))
+        repos.sort(key=lambda x: x[0].id.val)
 
         for idx, pair in enumerate(repos):
             if MRepo.checkedCast(pair[1]):
@@ -214,13 +214,16 @@ server-permissions.html
     def info(self, args):
         c = self.ctx.conn(args)
         a = c.sf.getAdminService()
-        [gid, groups] = self.list_groups(a, args, use_context=True)
+        q = c.sf.getQueryService()
+        [gid, groups] = self.list_groups(a, q, args, use_context=True)
         self.output_groups_list(groups, args)
 
     def listusers(self, args):
         c = self.ctx.conn(args)
         admin = c.sf.getAdminService()
-        [gids, groups] = self.list_groups(admin, args, use_context=True)
+        query = c.sf.getQueryService()
+        [gids, groups] = self.list_groups(admin, query, args,
+                                          use_context=True)
         if len(gids) != 1:
             self.ctx.die(516, 'Too many group arguments')
         users = admin.containedExperimenters(gids[0])
@@ -640,6 +640,7 @@ class SessionsControl(UserGroupControl):
             rv[0].killSession()
         except Exception, e:
             self.ctx.dbg("Exception on logout: %s" % e)
+        self.ctx.reset_client_check()
         store.remove(*previous[:-1])
         # Last is still useful. Not resetting.
         # store.set_current("", "", "")
@@ -13,10 +13,12 @@ import sys
 from omero.cli import UserGroupControl, CLI, ExceptionHandler, admin_only
 from omero.model.enums import (AdminPrivilegeModifyGroupMembership,
                                AdminPrivilegeModifyUser)
-from omero.rtypes import unwrap as _
 
 HELP = "Support for adding and managing users"
 
+#: Number of --one email records written per call to ctx.out
+EMAIL_BATCH_SIZE = 1024
+
 
 class UserControl(UserGroupControl):
 
@@ -113,28 +115,27 @@ class UserControl(UserGroupControl):
             x.add_login_arguments()
 
     def format_name(self, exp):
-        record = ""
-        fn = _(exp.firstName)
-        mn = " "
-        if _(exp.middleName):
-            mn = " %s " % _(exp.middleName)
-        ln = _(exp.lastName)
-        record += "%s%s%s" % (fn, mn, ln)
-        return record
+        fn = exp.firstName.val
+        mn = exp.middleName and exp.middleName.val
+        ln = exp.lastName.val
+        if mn:
+            return "%s %s %s" % (fn, mn, ln)
+        return "%s %s" % (fn, ln)
 
     def email(self, args):
         c = self.ctx.conn(args)
         a = c.sf.getAdminService()
-        r = a.getSecurityRoles()
+        r = self._get_roles(a)
 
         skipped = []
         records = []
         for exp in a.lookupExperimenters():
 
             # Handle users without email
-            if not _(exp.email):
+            em = exp.email and exp.email.val
+            if not em:
                 if not args.ignore:
-                    skipped.append(exp)
+                    skipped.append(self.format_name(exp))
                 continue
 
             # Handle deactivated users
@@ -144,25 +145,26 @@ class UserControl(UserGroupControl):
                 if r.userGroupId not in group_ids:
                     continue
 
-            record = ""
             if args.names:
-                record += '"%s"' % self.format_name(exp)
-                record += " <%s>" % _(exp.email)
+                record = '"%s" <%s>' % (self.format_name(exp), em)
             else:
-                record += _(exp.email)
+                record = em
 
             records.append(record)
+            if args.one and len(records) >= EMAIL_BATCH_SIZE:
+                self.ctx.out("\n".join(records))
+                records = []
 
         if args.one:
-            for record in records:
-                self.ctx.out(record)
+            if records:
+                self.ctx.out("\n".join(records))
         else:
             self.ctx.out(", ".join(records))
 
         if skipped:
             self.ctx.err("Missing email addresses:")
-            for s in skipped:
-                self.ctx.err(self.format_name(s))
+            for name in skipped:
+                self.ctx.err(name)
 
     def password(self, args):
         import omero
@@ -270,9 +272,11 @@ class UserControl(UserGroupControl):
         except omero.ApiUsageException:
             pass  # Apparently no such user exists
 
-        [gid, groups] = self.list_groups(admin, args, use_context=False)
+        query = c.getSession().getQueryService()
+        [gid, groups] = self.list_groups(admin, query, args,
+                                         use_context=False)
 
-        roles = admin.getSecurityRoles()
+        roles = self._get_roles(admin)
         groups.append(Grp(roles.userGroupId, False))
         if args.admin:
             groups.append(Grp(roles.systemGroupId, False))
@@ -315,53 +319,57 @@ class UserControl(UserGroupControl):
 
     def filter_groups(self, groups, uid, owner=False, join=True):
 
-        for group in list(groups):
+        keep = []
+        for group in groups:
             if owner:
-                uid_list = self.getownerids(group)
+                uid_set = set(self.getownerids(group))
                 relation = "owner of"
             else:
-                uid_list = self.getuserids(group)
+                uid_set = set(self.getuserids(group))
                 relation = "in"
 
             if join:
-                if uid in uid_list:
+                if uid in uid_set:
                     self.ctx.out("%s is already %s group %s"
                                  % (uid, relation, group.id.val))
-                    groups.remove(group)
+                    continue
             else:
-                if uid not in uid_list:
+                if uid not in uid_set:
                     self.ctx.out("%s is not %s group %s"
                                  % (uid, relation, group.id.val))
-                    groups.remove(group)
-        return groups
+                    continue
+            keep.append(group)
+        return keep
 
     def joingroup(self, args):
         c = self.ctx.conn(args)
         a = c.sf.getAdminService()
 
         uid, username = self.parse_userid(a, args)
-        [gid, groups] = self.list_groups(a, args, use_context=False)
+        q = c.sf.getQueryService()
+        [gid, groups] = self.list_groups(a, q, args, use_context=False)
         groups = self.filter_groups(groups, uid, args.as_owner, True)
 
-        for group in groups:
-            if args.as_owner:
+        if args.as_owner:
+            for group in groups:
                 self.addownersbyid(a, group, [uid])
-            else:
-                self.addusersbyid(a, group, [uid])
+        else:
+            self.addgroupsbyid(a, uid, groups)
 
     def leavegroup(self, args):
         c = self.ctx.conn(args)
         a = c.sf.getAdminService()
 
         uid, username = self.parse_userid(a, args)
-        [gid, groups] = self.list_groups(a, args, use_context=False)
+        q = c.sf.getQueryService()
+        [gid, groups] = self.list_groups(a, q, args, use_context=False)
         groups = self.filter_groups(groups, uid, args.as_owner, False)
 
-        for group in list(groups):
-            if args.as_owner:
+        if args.as_owner:
+            for group in groups:
                 self.removeownersbyid(a, group, [uid])
-            else:
-                self.removeusersbyid(a, group, [uid])
+        else:
+            self.removegroupsbyid(a, uid, groups)
 try:
     register("user", UserControl, HELP)
 except NameError:
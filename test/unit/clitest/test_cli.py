@@ -11,10 +11,59 @@
 
 import pytest
 
-from omero.cli import CLI, NonZeroReturnCode
+from omero.cli import BaseControl, CLI, NonZeroReturnCode
 from omero.plugins.basics import LoadControl
 
 
+class MockClient(object):
+
+    def __init__(self):
+        self.pings = 0
+        self.dead = False
+        self.closed = False
+
+    def getSession(self):
+        return self
+
+    def keepAlive(self, proxy):
+        self.pings += 1
+        if self.dead:
+            raise Exception("Session is dead")
+
+    def closeSession(self):
+        self.closed = True
+
+
+class ConnControl(BaseControl):
+
+    def _configure(self, parser):
+        parser.set_defaults(func=self.__call__)
+
+    def __call__(self, args):
+        self.ctx.conn()
+        self.ctx.conn()
+
+
+class KillControl(BaseControl):
+
+    def _configure(self, parser):
+        parser.set_defaults(func=self.__call__)
+
+    def __call__(self, args):
+        self.ctx.get_client().dead = True
+
+
+class NestedControl(BaseControl):
+
+    def _configure(self, parser):
+        parser.set_defaults(func=self.__call__)
+
+    def __call__(self, args):
+        self.ctx.invoke(["conn"])
+        self.ctx.invoke(["kill"])
+        self.ctx.invoke(["conn"])
+
+
 class TestCli(object):
 
     def testMultipleLoad(self):
@@ -61,3 +110,29 @@ class TestCli(object):
 
         self.cli.invoke("load -k %s" % tmpfile, strict=True)
         self.cli.invoke("load --keep-going %s" % tmpfile, strict=True)
+
+    def testConnPingsOncePerCommand(self):
+        self.cli = CLI()
+        self.cli.register("conn", ConnControl, "help")
+        client = MockClient()
+        self.cli.set_client(client)
+
+        self.cli.onecmd(["conn"])
+        assert self.cli.rv == 0
+        assert client.pings == 1
+
+        self.cli.onecmd(["conn"])
+        assert self.cli.rv == 0
+        assert client.pings == 2
+
+        # Nested commands each ping, so a killed session is dropped
+        self.cli.register("kill", KillControl, "help")
+        self.cli.register("nested", NestedControl, "help")
+        client = MockClient()
+        self.cli.set_client(client)
+
+        self.cli.onecmd(["nested"])
+        assert self.cli.rv == 0
+        assert client.pings == 2
+        assert client.closed
+        assert self.cli.get_client() is None
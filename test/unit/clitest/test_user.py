@@ -20,7 +20,10 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 from omero.plugins.user import UserControl
-from omero.cli import CLI
+from omero.cli import CLI, NonZeroReturnCode
+from omero.model import ExperimenterGroupI
+from omero.rtypes import rstring
+from omero_ext.argparse import Namespace
 import pytest
 
 
@@ -41,3 +44,112 @@ class TestUser(object):
     def testSubcommandHelp(self, subcommand):
         self.args += [subcommand, "-h"]
         self.cli.invoke(self.args, strict=True)
+
+
+class MockQuery(object):
+
+    def __init__(self, groups):
+        self.groups = groups
+        self.calls = []
+
+    def findAllByQuery(self, query, params, ctx=None):
+        self.calls.append((query, params))
+        return self.groups
+
+
+class MockAdmin(object):
+
+    def __init__(self, groups):
+        self.groups = groups
+
+    def getGroup(self, id):
+        return [g for g in self.groups if g.id.val == id][0]
+
+
+class MockContext(object):
+
+    def __init__(self, group_id=None):
+        self.errors = []
+        self.group_id = group_id
+
+    def get_event_context(self):
+        return Namespace(groupId=self.group_id)
+
+    def err(self, text, newline=True):
+        self.errors.append(text)
+
+    def die(self, rc, text):
+        raise NonZeroReturnCode(rc, text)
+
+
+class TestFindGroups(object):
+
+    def setup_method(self, method):
+        self.groups = []
+
+    def group(self, id, name):
+        g = ExperimenterGroupI(id, True)
+        g.name = rstring(name)
+        self.groups.append(g)
+        return g
+
+    def list_groups(self, group_id_or_name=None, group_id=None,
+                    group_name=None, use_context=False, context_group=None):
+        self.ctx = MockContext(context_group)
+        self.query = MockQuery(self.groups)
+        control = UserControl(ctx=self.ctx)
+        args = Namespace(group_id_or_name=group_id_or_name,
+                         group_id=group_id, group_name=group_name)
+        return control.list_groups(MockAdmin(self.groups), self.query, args,
+                                   use_context=use_context)
+
+    def testMixedIdsAndNames(self):
+        g1 = self.group(1, "one")
+        g2 = self.group(2, "two")
+        g3 = self.group(3, "three")
+        g4 = self.group(4, "four")
+        gids, groups = self.list_groups(
+            group_id_or_name=["one", "3"], group_id=["2"],
+            group_name=["four"])
+        assert gids == [1, 3, 2, 4]
+        assert groups == [g1, g3, g2, g4]
+        assert len(self.query.calls) == 1
+        assert not self.ctx.errors
+
+    def testAmbiguous(self):
+        self.group(5, "five")
+        self.group(6, "5")
+        with pytest.raises(NonZeroReturnCode) as exc:
+            self.list_groups(group_id_or_name=["5"])
+        assert exc.value.rv == 504
+        assert self.ctx.errors == ["Ambiguous group identifier: 5"]
+
+    def testMissing(self):
+        self.group(1, "one")
+        gids, groups = self.list_groups(
+            group_id=["1", "7"], group_name=["nope"])
+        assert gids == [1]
+        assert self.ctx.errors == ["Unknown group: 7", "Unknown group: nope"]
+
+    def testInvalidIdOnly(self):
+        with pytest.raises(NonZeroReturnCode) as exc:
+            self.list_groups(group_id=["abc"])
+        assert exc.value.rv == 504
+        assert self.ctx.errors == ["Not a valid group ID: abc"]
+        assert not self.query.calls
+
+    @pytest.mark.parametrize("use_context", [True, False])
+    def testSingleQuery(self, use_context):
+        g1 = self.group(1, "one")
+        g2 = self.group(2, "two")
+        gids, groups = self.list_groups(
+            group_id=["1"], group_name=["two"], use_context=use_context)
+        assert groups == [g1, g2]
+        assert len(self.query.calls) == 1
+
+    def testContextGroup(self):
+        g3 = self.group(3, "three")
+        gids, groups = self.list_groups(use_context=True, context_group=3)
+        assert gids == [3]
+        assert groups == [g3]
+        assert not self.query.calls